@@ -0,0 +1,658 @@
+# This file is generated by gen_joint_ids.py, do not edit it by hand.
+from types import MappingProxyType
+from typing import Final
+
+import numpy as np
+
+# Dict containing the joints in numerical order
+_JOINT_IDS = {
+    'OP Nose': 0,
+    'OP Neck': 1,
+    'OP RShoulder': 2,
+    'OP RElbow': 3,
+    'OP RWrist': 4,
+    'OP LShoulder': 5,
+    'OP LElbow': 6,
+    'OP LWrist': 7,
+    'OP MidHip': 8,
+    'OP RHip': 9,
+    'OP RKnee': 10,
+    'OP RAnkle': 11,
+    'OP LHip': 12,
+    'OP LKnee': 13,
+    'OP LAnkle': 14,
+    'OP REye': 15,
+    'OP LEye': 16,
+    'OP REar': 17,
+    'OP LEar': 18,
+    'OP LBigToe': 19,
+    'OP LSmallToe': 20,
+    'OP LHeel': 21,
+    'OP RBigToe': 22,
+    'OP RSmallToe': 23,
+    'OP RHeel': 24,
+    'Right Ankle': 25,
+    'Right Knee': 26,
+    'Right Hip': 27,
+    'Left Hip': 28,
+    'Left Knee': 29,
+    'Left Ankle': 30,
+    'Right Wrist': 31,
+    'Right Elbow': 32,
+    'Right Shoulder': 33,
+    'Left Shoulder': 34,
+    'Left Elbow': 35,
+    'Left Wrist': 36,
+    'Neck (LSP)': 37,
+    'Top of Head (LSP)': 38,
+    'Pelvis (MPII)': 39,
+    'Thorax (MPII)': 40,
+    'Spine (H36M)': 41,
+    'Jaw (H36M)': 42,
+    'Head (H36M)': 43,
+    'Nose': 44,
+    'Left Eye': 45,
+    'Right Eye': 46,
+    'Left Ear': 47,
+    'Right Ear': 48,
+}
+JOINT_IDS = MappingProxyType(_JOINT_IDS)
+
+# Dict containing the SMPL-X joints in numerical order
+_SMPLX_JOINT_IDS = {
+    'pelvis': 0,
+    'left_hip': 1,
+    'right_hip': 2,
+    'spine1': 3,
+    'left_knee': 4,
+    'right_knee': 5,
+    'spine2': 6,
+    'left_ankle': 7,
+    'right_ankle': 8,
+    'spine3': 9,
+    'left_foot': 10,
+    'right_foot': 11,
+    'neck': 12,
+    'left_collar': 13,
+    'right_collar': 14,
+    'head': 15,
+    'left_shoulder': 16,
+    'right_shoulder': 17,
+    'left_elbow': 18,
+    'right_elbow': 19,
+    'left_wrist': 20,
+    'right_wrist': 21,
+    'jaw': 22,
+    'left_eye_smplhf': 23,
+    'right_eye_smplhf': 24,
+    'left_index1': 25,
+    'left_index2': 26,
+    'left_index3': 27,
+    'left_middle1': 28,
+    'left_middle2': 29,
+    'left_middle3': 30,
+    'left_pinky1': 31,
+    'left_pinky2': 32,
+    'left_pinky3': 33,
+    'left_ring1': 34,
+    'left_ring2': 35,
+    'left_ring3': 36,
+    'left_thumb1': 37,
+    'left_thumb2': 38,
+    'left_thumb3': 39,
+    'right_index1': 40,
+    'right_index2': 41,
+    'right_index3': 42,
+    'right_middle1': 43,
+    'right_middle2': 44,
+    'right_middle3': 45,
+    'right_pinky1': 46,
+    'right_pinky2': 47,
+    'right_pinky3': 48,
+    'right_ring1': 49,
+    'right_ring2': 50,
+    'right_ring3': 51,
+    'right_thumb1': 52,
+    'right_thumb2': 53,
+    'right_thumb3': 54,
+    'nose': 55,
+    'right_eye': 56,
+    'left_eye': 57,
+    'right_ear': 58,
+    'left_ear': 59,
+    'left_big_toe': 60,
+    'left_small_toe': 61,
+    'left_heel': 62,
+    'right_big_toe': 63,
+    'right_small_toe': 64,
+    'right_heel': 65,
+    'left_thumb': 66,
+    'left_index': 67,
+    'left_middle': 68,
+    'left_ring': 69,
+    'left_pinky': 70,
+    'right_thumb': 71,
+    'right_index': 72,
+    'right_middle': 73,
+    'right_ring': 74,
+    'right_pinky': 75,
+    'right_eye_brow1': 76,
+    'right_eye_brow2': 77,
+    'right_eye_brow3': 78,
+    'right_eye_brow4': 79,
+    'right_eye_brow5': 80,
+    'left_eye_brow5': 81,
+    'left_eye_brow4': 82,
+    'left_eye_brow3': 83,
+    'left_eye_brow2': 84,
+    'left_eye_brow1': 85,
+    'nose1': 86,
+    'nose2': 87,
+    'nose3': 88,
+    'nose4': 89,
+    'right_nose_2': 90,
+    'right_nose_1': 91,
+    'nose_middle': 92,
+    'left_nose_1': 93,
+    'left_nose_2': 94,
+    'right_eye1': 95,
+    'right_eye2': 96,
+    'right_eye3': 97,
+    'right_eye4': 98,
+    'right_eye5': 99,
+    'right_eye6': 100,
+    'left_eye4': 101,
+    'left_eye3': 102,
+    'left_eye2': 103,
+    'left_eye1': 104,
+    'left_eye6': 105,
+    'left_eye5': 106,
+    'right_mouth_1': 107,
+    'right_mouth_2': 108,
+    'right_mouth_3': 109,
+    'mouth_top': 110,
+    'left_mouth_3': 111,
+    'left_mouth_2': 112,
+    'left_mouth_1': 113,
+    'left_mouth_5': 114,
+    'left_mouth_4': 115,
+    'mouth_bottom': 116,
+    'right_mouth_4': 117,
+    'right_mouth_5': 118,
+    'right_lip_1': 119,
+    'right_lip_2': 120,
+    'lip_top': 121,
+    'left_lip_2': 122,
+    'left_lip_1': 123,
+    'left_lip_3': 124,
+    'lip_bottom': 125,
+    'right_lip_3': 126,
+    'right_contour_1': 127,
+    'right_contour_2': 128,
+    'right_contour_3': 129,
+    'right_contour_4': 130,
+    'right_contour_5': 131,
+    'right_contour_6': 132,
+    'right_contour_7': 133,
+    'right_contour_8': 134,
+    'contour_middle': 135,
+    'left_contour_8': 136,
+    'left_contour_7': 137,
+    'left_contour_6': 138,
+    'left_contour_5': 139,
+    'left_contour_4': 140,
+    'left_contour_3': 141,
+    'left_contour_2': 142,
+    'left_contour_1': 143,
+}
+SMPLX_JOINT_IDS = MappingProxyType(_SMPLX_JOINT_IDS)
+
+joint_id = _JOINT_IDS.__getitem__
+smplx_joint_id = _SMPLX_JOINT_IDS.__getitem__
+
+JOINT_ID_ARRAY = np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48], dtype=np.int32)
+
+OP_NOSE_ID: Final[int] = 0
+OP_NECK_ID: Final[int] = 1
+OP_RSHOULDER_ID: Final[int] = 2
+OP_RELBOW_ID: Final[int] = 3
+OP_RWRIST_ID: Final[int] = 4
+OP_LSHOULDER_ID: Final[int] = 5
+OP_LELBOW_ID: Final[int] = 6
+OP_LWRIST_ID: Final[int] = 7
+OP_MIDHIP_ID: Final[int] = 8
+OP_RHIP_ID: Final[int] = 9
+OP_RKNEE_ID: Final[int] = 10
+OP_RANKLE_ID: Final[int] = 11
+OP_LHIP_ID: Final[int] = 12
+OP_LKNEE_ID: Final[int] = 13
+OP_LANKLE_ID: Final[int] = 14
+OP_REYE_ID: Final[int] = 15
+OP_LEYE_ID: Final[int] = 16
+OP_REAR_ID: Final[int] = 17
+OP_LEAR_ID: Final[int] = 18
+OP_LBIGTOE_ID: Final[int] = 19
+OP_LSMALLTOE_ID: Final[int] = 20
+OP_LHEEL_ID: Final[int] = 21
+OP_RBIGTOE_ID: Final[int] = 22
+OP_RSMALLTOE_ID: Final[int] = 23
+OP_RHEEL_ID: Final[int] = 24
+RIGHT_ANKLE_ID: Final[int] = 25
+RIGHT_KNEE_ID: Final[int] = 26
+RIGHT_HIP_ID: Final[int] = 27
+LEFT_HIP_ID: Final[int] = 28
+LEFT_KNEE_ID: Final[int] = 29
+LEFT_ANKLE_ID: Final[int] = 30
+RIGHT_WRIST_ID: Final[int] = 31
+RIGHT_ELBOW_ID: Final[int] = 32
+RIGHT_SHOULDER_ID: Final[int] = 33
+LEFT_SHOULDER_ID: Final[int] = 34
+LEFT_ELBOW_ID: Final[int] = 35
+LEFT_WRIST_ID: Final[int] = 36
+NECK_LSP_ID: Final[int] = 37
+TOP_OF_HEAD_LSP_ID: Final[int] = 38
+PELVIS_MPII_ID: Final[int] = 39
+THORAX_MPII_ID: Final[int] = 40
+SPINE_H36M_ID: Final[int] = 41
+JAW_H36M_ID: Final[int] = 42
+HEAD_H36M_ID: Final[int] = 43
+NOSE_ID: Final[int] = 44
+LEFT_EYE_ID: Final[int] = 45
+RIGHT_EYE_ID: Final[int] = 46
+LEFT_EAR_ID: Final[int] = 47
+RIGHT_EAR_ID: Final[int] = 48
+
+SMPLX_PELVIS_ID: Final[int] = 0
+SMPLX_LEFT_HIP_ID: Final[int] = 1
+SMPLX_RIGHT_HIP_ID: Final[int] = 2
+SMPLX_SPINE1_ID: Final[int] = 3
+SMPLX_LEFT_KNEE_ID: Final[int] = 4
+SMPLX_RIGHT_KNEE_ID: Final[int] = 5
+SMPLX_SPINE2_ID: Final[int] = 6
+SMPLX_LEFT_ANKLE_ID: Final[int] = 7
+SMPLX_RIGHT_ANKLE_ID: Final[int] = 8
+SMPLX_SPINE3_ID: Final[int] = 9
+SMPLX_LEFT_FOOT_ID: Final[int] = 10
+SMPLX_RIGHT_FOOT_ID: Final[int] = 11
+SMPLX_NECK_ID: Final[int] = 12
+SMPLX_LEFT_COLLAR_ID: Final[int] = 13
+SMPLX_RIGHT_COLLAR_ID: Final[int] = 14
+SMPLX_HEAD_ID: Final[int] = 15
+SMPLX_LEFT_SHOULDER_ID: Final[int] = 16
+SMPLX_RIGHT_SHOULDER_ID: Final[int] = 17
+SMPLX_LEFT_ELBOW_ID: Final[int] = 18
+SMPLX_RIGHT_ELBOW_ID: Final[int] = 19
+SMPLX_LEFT_WRIST_ID: Final[int] = 20
+SMPLX_RIGHT_WRIST_ID: Final[int] = 21
+SMPLX_JAW_ID: Final[int] = 22
+SMPLX_LEFT_EYE_SMPLHF_ID: Final[int] = 23
+SMPLX_RIGHT_EYE_SMPLHF_ID: Final[int] = 24
+SMPLX_LEFT_INDEX1_ID: Final[int] = 25
+SMPLX_LEFT_INDEX2_ID: Final[int] = 26
+SMPLX_LEFT_INDEX3_ID: Final[int] = 27
+SMPLX_LEFT_MIDDLE1_ID: Final[int] = 28
+SMPLX_LEFT_MIDDLE2_ID: Final[int] = 29
+SMPLX_LEFT_MIDDLE3_ID: Final[int] = 30
+SMPLX_LEFT_PINKY1_ID: Final[int] = 31
+SMPLX_LEFT_PINKY2_ID: Final[int] = 32
+SMPLX_LEFT_PINKY3_ID: Final[int] = 33
+SMPLX_LEFT_RING1_ID: Final[int] = 34
+SMPLX_LEFT_RING2_ID: Final[int] = 35
+SMPLX_LEFT_RING3_ID: Final[int] = 36
+SMPLX_LEFT_THUMB1_ID: Final[int] = 37
+SMPLX_LEFT_THUMB2_ID: Final[int] = 38
+SMPLX_LEFT_THUMB3_ID: Final[int] = 39
+SMPLX_RIGHT_INDEX1_ID: Final[int] = 40
+SMPLX_RIGHT_INDEX2_ID: Final[int] = 41
+SMPLX_RIGHT_INDEX3_ID: Final[int] = 42
+SMPLX_RIGHT_MIDDLE1_ID: Final[int] = 43
+SMPLX_RIGHT_MIDDLE2_ID: Final[int] = 44
+SMPLX_RIGHT_MIDDLE3_ID: Final[int] = 45
+SMPLX_RIGHT_PINKY1_ID: Final[int] = 46
+SMPLX_RIGHT_PINKY2_ID: Final[int] = 47
+SMPLX_RIGHT_PINKY3_ID: Final[int] = 48
+SMPLX_RIGHT_RING1_ID: Final[int] = 49
+SMPLX_RIGHT_RING2_ID: Final[int] = 50
+SMPLX_RIGHT_RING3_ID: Final[int] = 51
+SMPLX_RIGHT_THUMB1_ID: Final[int] = 52
+SMPLX_RIGHT_THUMB2_ID: Final[int] = 53
+SMPLX_RIGHT_THUMB3_ID: Final[int] = 54
+SMPLX_NOSE_ID: Final[int] = 55
+SMPLX_RIGHT_EYE_ID: Final[int] = 56
+SMPLX_LEFT_EYE_ID: Final[int] = 57
+SMPLX_RIGHT_EAR_ID: Final[int] = 58
+SMPLX_LEFT_EAR_ID: Final[int] = 59
+SMPLX_LEFT_BIG_TOE_ID: Final[int] = 60
+SMPLX_LEFT_SMALL_TOE_ID: Final[int] = 61
+SMPLX_LEFT_HEEL_ID: Final[int] = 62
+SMPLX_RIGHT_BIG_TOE_ID: Final[int] = 63
+SMPLX_RIGHT_SMALL_TOE_ID: Final[int] = 64
+SMPLX_RIGHT_HEEL_ID: Final[int] = 65
+SMPLX_LEFT_THUMB_ID: Final[int] = 66
+SMPLX_LEFT_INDEX_ID: Final[int] = 67
+SMPLX_LEFT_MIDDLE_ID: Final[int] = 68
+SMPLX_LEFT_RING_ID: Final[int] = 69
+SMPLX_LEFT_PINKY_ID: Final[int] = 70
+SMPLX_RIGHT_THUMB_ID: Final[int] = 71
+SMPLX_RIGHT_INDEX_ID: Final[int] = 72
+SMPLX_RIGHT_MIDDLE_ID: Final[int] = 73
+SMPLX_RIGHT_RING_ID: Final[int] = 74
+SMPLX_RIGHT_PINKY_ID: Final[int] = 75
+SMPLX_RIGHT_EYE_BROW1_ID: Final[int] = 76
+SMPLX_RIGHT_EYE_BROW2_ID: Final[int] = 77
+SMPLX_RIGHT_EYE_BROW3_ID: Final[int] = 78
+SMPLX_RIGHT_EYE_BROW4_ID: Final[int] = 79
+SMPLX_RIGHT_EYE_BROW5_ID: Final[int] = 80
+SMPLX_LEFT_EYE_BROW5_ID: Final[int] = 81
+SMPLX_LEFT_EYE_BROW4_ID: Final[int] = 82
+SMPLX_LEFT_EYE_BROW3_ID: Final[int] = 83
+SMPLX_LEFT_EYE_BROW2_ID: Final[int] = 84
+SMPLX_LEFT_EYE_BROW1_ID: Final[int] = 85
+SMPLX_NOSE1_ID: Final[int] = 86
+SMPLX_NOSE2_ID: Final[int] = 87
+SMPLX_NOSE3_ID: Final[int] = 88
+SMPLX_NOSE4_ID: Final[int] = 89
+SMPLX_RIGHT_NOSE_2_ID: Final[int] = 90
+SMPLX_RIGHT_NOSE_1_ID: Final[int] = 91
+SMPLX_NOSE_MIDDLE_ID: Final[int] = 92
+SMPLX_LEFT_NOSE_1_ID: Final[int] = 93
+SMPLX_LEFT_NOSE_2_ID: Final[int] = 94
+SMPLX_RIGHT_EYE1_ID: Final[int] = 95
+SMPLX_RIGHT_EYE2_ID: Final[int] = 96
+SMPLX_RIGHT_EYE3_ID: Final[int] = 97
+SMPLX_RIGHT_EYE4_ID: Final[int] = 98
+SMPLX_RIGHT_EYE5_ID: Final[int] = 99
+SMPLX_RIGHT_EYE6_ID: Final[int] = 100
+SMPLX_LEFT_EYE4_ID: Final[int] = 101
+SMPLX_LEFT_EYE3_ID: Final[int] = 102
+SMPLX_LEFT_EYE2_ID: Final[int] = 103
+SMPLX_LEFT_EYE1_ID: Final[int] = 104
+SMPLX_LEFT_EYE6_ID: Final[int] = 105
+SMPLX_LEFT_EYE5_ID: Final[int] = 106
+SMPLX_RIGHT_MOUTH_1_ID: Final[int] = 107
+SMPLX_RIGHT_MOUTH_2_ID: Final[int] = 108
+SMPLX_RIGHT_MOUTH_3_ID: Final[int] = 109
+SMPLX_MOUTH_TOP_ID: Final[int] = 110
+SMPLX_LEFT_MOUTH_3_ID: Final[int] = 111
+SMPLX_LEFT_MOUTH_2_ID: Final[int] = 112
+SMPLX_LEFT_MOUTH_1_ID: Final[int] = 113
+SMPLX_LEFT_MOUTH_5_ID: Final[int] = 114
+SMPLX_LEFT_MOUTH_4_ID: Final[int] = 115
+SMPLX_MOUTH_BOTTOM_ID: Final[int] = 116
+SMPLX_RIGHT_MOUTH_4_ID: Final[int] = 117
+SMPLX_RIGHT_MOUTH_5_ID: Final[int] = 118
+SMPLX_RIGHT_LIP_1_ID: Final[int] = 119
+SMPLX_RIGHT_LIP_2_ID: Final[int] = 120
+SMPLX_LIP_TOP_ID: Final[int] = 121
+SMPLX_LEFT_LIP_2_ID: Final[int] = 122
+SMPLX_LEFT_LIP_1_ID: Final[int] = 123
+SMPLX_LEFT_LIP_3_ID: Final[int] = 124
+SMPLX_LIP_BOTTOM_ID: Final[int] = 125
+SMPLX_RIGHT_LIP_3_ID: Final[int] = 126
+SMPLX_RIGHT_CONTOUR_1_ID: Final[int] = 127
+SMPLX_RIGHT_CONTOUR_2_ID: Final[int] = 128
+SMPLX_RIGHT_CONTOUR_3_ID: Final[int] = 129
+SMPLX_RIGHT_CONTOUR_4_ID: Final[int] = 130
+SMPLX_RIGHT_CONTOUR_5_ID: Final[int] = 131
+SMPLX_RIGHT_CONTOUR_6_ID: Final[int] = 132
+SMPLX_RIGHT_CONTOUR_7_ID: Final[int] = 133
+SMPLX_RIGHT_CONTOUR_8_ID: Final[int] = 134
+SMPLX_CONTOUR_MIDDLE_ID: Final[int] = 135
+SMPLX_LEFT_CONTOUR_8_ID: Final[int] = 136
+SMPLX_LEFT_CONTOUR_7_ID: Final[int] = 137
+SMPLX_LEFT_CONTOUR_6_ID: Final[int] = 138
+SMPLX_LEFT_CONTOUR_5_ID: Final[int] = 139
+SMPLX_LEFT_CONTOUR_4_ID: Final[int] = 140
+SMPLX_LEFT_CONTOUR_3_ID: Final[int] = 141
+SMPLX_LEFT_CONTOUR_2_ID: Final[int] = 142
+SMPLX_LEFT_CONTOUR_1_ID: Final[int] = 143
+
+SMPL_PART_RIGHT_HAND_ID: Final[int] = 1
+SMPL_PART_RIGHT_UP_LEG_ID: Final[int] = 2
+SMPL_PART_LEFT_ARM_ID: Final[int] = 3
+SMPL_PART_LEFT_LEG_ID: Final[int] = 4
+SMPL_PART_LEFT_TOE_BASE_ID: Final[int] = 5
+SMPL_PART_LEFT_FOOT_ID: Final[int] = 6
+SMPL_PART_SPINE1_ID: Final[int] = 7
+SMPL_PART_SPINE2_ID: Final[int] = 8
+SMPL_PART_LEFT_SHOULDER_ID: Final[int] = 9
+SMPL_PART_RIGHT_SHOULDER_ID: Final[int] = 10
+SMPL_PART_RIGHT_FOOT_ID: Final[int] = 11
+SMPL_PART_HEAD_ID: Final[int] = 12
+SMPL_PART_RIGHT_ARM_ID: Final[int] = 13
+SMPL_PART_LEFT_HAND_INDEX1_ID: Final[int] = 14
+SMPL_PART_RIGHT_LEG_ID: Final[int] = 15
+SMPL_PART_RIGHT_HAND_INDEX1_ID: Final[int] = 16
+SMPL_PART_LEFT_FORE_ARM_ID: Final[int] = 17
+SMPL_PART_RIGHT_FORE_ARM_ID: Final[int] = 18
+SMPL_PART_NECK_ID: Final[int] = 19
+SMPL_PART_RIGHT_TOE_BASE_ID: Final[int] = 20
+SMPL_PART_SPINE_ID: Final[int] = 21
+SMPL_PART_LEFT_UP_LEG_ID: Final[int] = 22
+SMPL_PART_LEFT_HAND_ID: Final[int] = 23
+SMPL_PART_HIPS_ID: Final[int] = 24
+
+__all__ = [
+    'JOINT_IDS',
+    'SMPLX_JOINT_IDS',
+    'joint_id',
+    'smplx_joint_id',
+    'JOINT_ID_ARRAY',
+    'OP_NOSE_ID',
+    'OP_NECK_ID',
+    'OP_RSHOULDER_ID',
+    'OP_RELBOW_ID',
+    'OP_RWRIST_ID',
+    'OP_LSHOULDER_ID',
+    'OP_LELBOW_ID',
+    'OP_LWRIST_ID',
+    'OP_MIDHIP_ID',
+    'OP_RHIP_ID',
+    'OP_RKNEE_ID',
+    'OP_RANKLE_ID',
+    'OP_LHIP_ID',
+    'OP_LKNEE_ID',
+    'OP_LANKLE_ID',
+    'OP_REYE_ID',
+    'OP_LEYE_ID',
+    'OP_REAR_ID',
+    'OP_LEAR_ID',
+    'OP_LBIGTOE_ID',
+    'OP_LSMALLTOE_ID',
+    'OP_LHEEL_ID',
+    'OP_RBIGTOE_ID',
+    'OP_RSMALLTOE_ID',
+    'OP_RHEEL_ID',
+    'RIGHT_ANKLE_ID',
+    'RIGHT_KNEE_ID',
+    'RIGHT_HIP_ID',
+    'LEFT_HIP_ID',
+    'LEFT_KNEE_ID',
+    'LEFT_ANKLE_ID',
+    'RIGHT_WRIST_ID',
+    'RIGHT_ELBOW_ID',
+    'RIGHT_SHOULDER_ID',
+    'LEFT_SHOULDER_ID',
+    'LEFT_ELBOW_ID',
+    'LEFT_WRIST_ID',
+    'NECK_LSP_ID',
+    'TOP_OF_HEAD_LSP_ID',
+    'PELVIS_MPII_ID',
+    'THORAX_MPII_ID',
+    'SPINE_H36M_ID',
+    'JAW_H36M_ID',
+    'HEAD_H36M_ID',
+    'NOSE_ID',
+    'LEFT_EYE_ID',
+    'RIGHT_EYE_ID',
+    'LEFT_EAR_ID',
+    'RIGHT_EAR_ID',
+    'SMPLX_PELVIS_ID',
+    'SMPLX_LEFT_HIP_ID',
+    'SMPLX_RIGHT_HIP_ID',
+    'SMPLX_SPINE1_ID',
+    'SMPLX_LEFT_KNEE_ID',
+    'SMPLX_RIGHT_KNEE_ID',
+    'SMPLX_SPINE2_ID',
+    'SMPLX_LEFT_ANKLE_ID',
+    'SMPLX_RIGHT_ANKLE_ID',
+    'SMPLX_SPINE3_ID',
+    'SMPLX_LEFT_FOOT_ID',
+    'SMPLX_RIGHT_FOOT_ID',
+    'SMPLX_NECK_ID',
+    'SMPLX_LEFT_COLLAR_ID',
+    'SMPLX_RIGHT_COLLAR_ID',
+    'SMPLX_HEAD_ID',
+    'SMPLX_LEFT_SHOULDER_ID',
+    'SMPLX_RIGHT_SHOULDER_ID',
+    'SMPLX_LEFT_ELBOW_ID',
+    'SMPLX_RIGHT_ELBOW_ID',
+    'SMPLX_LEFT_WRIST_ID',
+    'SMPLX_RIGHT_WRIST_ID',
+    'SMPLX_JAW_ID',
+    'SMPLX_LEFT_EYE_SMPLHF_ID',
+    'SMPLX_RIGHT_EYE_SMPLHF_ID',
+    'SMPLX_LEFT_INDEX1_ID',
+    'SMPLX_LEFT_INDEX2_ID',
+    'SMPLX_LEFT_INDEX3_ID',
+    'SMPLX_LEFT_MIDDLE1_ID',
+    'SMPLX_LEFT_MIDDLE2_ID',
+    'SMPLX_LEFT_MIDDLE3_ID',
+    'SMPLX_LEFT_PINKY1_ID',
+    'SMPLX_LEFT_PINKY2_ID',
+    'SMPLX_LEFT_PINKY3_ID',
+    'SMPLX_LEFT_RING1_ID',
+    'SMPLX_LEFT_RING2_ID',
+    'SMPLX_LEFT_RING3_ID',
+    'SMPLX_LEFT_THUMB1_ID',
+    'SMPLX_LEFT_THUMB2_ID',
+    'SMPLX_LEFT_THUMB3_ID',
+    'SMPLX_RIGHT_INDEX1_ID',
+    'SMPLX_RIGHT_INDEX2_ID',
+    'SMPLX_RIGHT_INDEX3_ID',
+    'SMPLX_RIGHT_MIDDLE1_ID',
+    'SMPLX_RIGHT_MIDDLE2_ID',
+    'SMPLX_RIGHT_MIDDLE3_ID',
+    'SMPLX_RIGHT_PINKY1_ID',
+    'SMPLX_RIGHT_PINKY2_ID',
+    'SMPLX_RIGHT_PINKY3_ID',
+    'SMPLX_RIGHT_RING1_ID',
+    'SMPLX_RIGHT_RING2_ID',
+    'SMPLX_RIGHT_RING3_ID',
+    'SMPLX_RIGHT_THUMB1_ID',
+    'SMPLX_RIGHT_THUMB2_ID',
+    'SMPLX_RIGHT_THUMB3_ID',
+    'SMPLX_NOSE_ID',
+    'SMPLX_RIGHT_EYE_ID',
+    'SMPLX_LEFT_EYE_ID',
+    'SMPLX_RIGHT_EAR_ID',
+    'SMPLX_LEFT_EAR_ID',
+    'SMPLX_LEFT_BIG_TOE_ID',
+    'SMPLX_LEFT_SMALL_TOE_ID',
+    'SMPLX_LEFT_HEEL_ID',
+    'SMPLX_RIGHT_BIG_TOE_ID',
+    'SMPLX_RIGHT_SMALL_TOE_ID',
+    'SMPLX_RIGHT_HEEL_ID',
+    'SMPLX_LEFT_THUMB_ID',
+    'SMPLX_LEFT_INDEX_ID',
+    'SMPLX_LEFT_MIDDLE_ID',
+    'SMPLX_LEFT_RING_ID',
+    'SMPLX_LEFT_PINKY_ID',
+    'SMPLX_RIGHT_THUMB_ID',
+    'SMPLX_RIGHT_INDEX_ID',
+    'SMPLX_RIGHT_MIDDLE_ID',
+    'SMPLX_RIGHT_RING_ID',
+    'SMPLX_RIGHT_PINKY_ID',
+    'SMPLX_RIGHT_EYE_BROW1_ID',
+    'SMPLX_RIGHT_EYE_BROW2_ID',
+    'SMPLX_RIGHT_EYE_BROW3_ID',
+    'SMPLX_RIGHT_EYE_BROW4_ID',
+    'SMPLX_RIGHT_EYE_BROW5_ID',
+    'SMPLX_LEFT_EYE_BROW5_ID',
+    'SMPLX_LEFT_EYE_BROW4_ID',
+    'SMPLX_LEFT_EYE_BROW3_ID',
+    'SMPLX_LEFT_EYE_BROW2_ID',
+    'SMPLX_LEFT_EYE_BROW1_ID',
+    'SMPLX_NOSE1_ID',
+    'SMPLX_NOSE2_ID',
+    'SMPLX_NOSE3_ID',
+    'SMPLX_NOSE4_ID',
+    'SMPLX_RIGHT_NOSE_2_ID',
+    'SMPLX_RIGHT_NOSE_1_ID',
+    'SMPLX_NOSE_MIDDLE_ID',
+    'SMPLX_LEFT_NOSE_1_ID',
+    'SMPLX_LEFT_NOSE_2_ID',
+    'SMPLX_RIGHT_EYE1_ID',
+    'SMPLX_RIGHT_EYE2_ID',
+    'SMPLX_RIGHT_EYE3_ID',
+    'SMPLX_RIGHT_EYE4_ID',
+    'SMPLX_RIGHT_EYE5_ID',
+    'SMPLX_RIGHT_EYE6_ID',
+    'SMPLX_LEFT_EYE4_ID',
+    'SMPLX_LEFT_EYE3_ID',
+    'SMPLX_LEFT_EYE2_ID',
+    'SMPLX_LEFT_EYE1_ID',
+    'SMPLX_LEFT_EYE6_ID',
+    'SMPLX_LEFT_EYE5_ID',
+    'SMPLX_RIGHT_MOUTH_1_ID',
+    'SMPLX_RIGHT_MOUTH_2_ID',
+    'SMPLX_RIGHT_MOUTH_3_ID',
+    'SMPLX_MOUTH_TOP_ID',
+    'SMPLX_LEFT_MOUTH_3_ID',
+    'SMPLX_LEFT_MOUTH_2_ID',
+    'SMPLX_LEFT_MOUTH_1_ID',
+    'SMPLX_LEFT_MOUTH_5_ID',
+    'SMPLX_LEFT_MOUTH_4_ID',
+    'SMPLX_MOUTH_BOTTOM_ID',
+    'SMPLX_RIGHT_MOUTH_4_ID',
+    'SMPLX_RIGHT_MOUTH_5_ID',
+    'SMPLX_RIGHT_LIP_1_ID',
+    'SMPLX_RIGHT_LIP_2_ID',
+    'SMPLX_LIP_TOP_ID',
+    'SMPLX_LEFT_LIP_2_ID',
+    'SMPLX_LEFT_LIP_1_ID',
+    'SMPLX_LEFT_LIP_3_ID',
+    'SMPLX_LIP_BOTTOM_ID',
+    'SMPLX_RIGHT_LIP_3_ID',
+    'SMPLX_RIGHT_CONTOUR_1_ID',
+    'SMPLX_RIGHT_CONTOUR_2_ID',
+    'SMPLX_RIGHT_CONTOUR_3_ID',
+    'SMPLX_RIGHT_CONTOUR_4_ID',
+    'SMPLX_RIGHT_CONTOUR_5_ID',
+    'SMPLX_RIGHT_CONTOUR_6_ID',
+    'SMPLX_RIGHT_CONTOUR_7_ID',
+    'SMPLX_RIGHT_CONTOUR_8_ID',
+    'SMPLX_CONTOUR_MIDDLE_ID',
+    'SMPLX_LEFT_CONTOUR_8_ID',
+    'SMPLX_LEFT_CONTOUR_7_ID',
+    'SMPLX_LEFT_CONTOUR_6_ID',
+    'SMPLX_LEFT_CONTOUR_5_ID',
+    'SMPLX_LEFT_CONTOUR_4_ID',
+    'SMPLX_LEFT_CONTOUR_3_ID',
+    'SMPLX_LEFT_CONTOUR_2_ID',
+    'SMPLX_LEFT_CONTOUR_1_ID',
+    'SMPL_PART_RIGHT_HAND_ID',
+    'SMPL_PART_RIGHT_UP_LEG_ID',
+    'SMPL_PART_LEFT_ARM_ID',
+    'SMPL_PART_LEFT_LEG_ID',
+    'SMPL_PART_LEFT_TOE_BASE_ID',
+    'SMPL_PART_LEFT_FOOT_ID',
+    'SMPL_PART_SPINE1_ID',
+    'SMPL_PART_SPINE2_ID',
+    'SMPL_PART_LEFT_SHOULDER_ID',
+    'SMPL_PART_RIGHT_SHOULDER_ID',
+    'SMPL_PART_RIGHT_FOOT_ID',
+    'SMPL_PART_HEAD_ID',
+    'SMPL_PART_RIGHT_ARM_ID',
+    'SMPL_PART_LEFT_HAND_INDEX1_ID',
+    'SMPL_PART_RIGHT_LEG_ID',
+    'SMPL_PART_RIGHT_HAND_INDEX1_ID',
+    'SMPL_PART_LEFT_FORE_ARM_ID',
+    'SMPL_PART_RIGHT_FORE_ARM_ID',
+    'SMPL_PART_NECK_ID',
+    'SMPL_PART_RIGHT_TOE_BASE_ID',
+    'SMPL_PART_SPINE_ID',
+    'SMPL_PART_LEFT_UP_LEG_ID',
+    'SMPL_PART_LEFT_HAND_ID',
+    'SMPL_PART_HIPS_ID',
+]
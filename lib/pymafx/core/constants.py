@@ -1,10 +1,33 @@
 # This script is borrowed and extended from https://github.com/nkolot/SPIN/blob/master/constants.py
+import functools
+from types import MappingProxyType
+
+import numpy as np
+
 FOCAL_LENGTH = 5000.0
 IMG_RES = 224
 
 # Mean and standard deviation for normalizing input image
 IMG_NORM_MEAN = [0.485, 0.456, 0.406]
 IMG_NORM_STD = [0.229, 0.224, 0.225]
+_IMG_NORM_MEAN_NP = np.asarray(IMG_NORM_MEAN, dtype=np.float32).reshape(1, 3, 1, 1)
+_IMG_NORM_STD_NP = np.asarray(IMG_NORM_STD, dtype=np.float32).reshape(1, 3, 1, 1)
+
+
+@functools.lru_cache(maxsize=None)
+def img_norm_mean(device='cpu', dtype=None):
+    """Cached (1, 3, 1, 1) IMG_NORM_MEAN tensor, e.g. (x - img_norm_mean(x.device, x.dtype))."""
+    import torch
+    return torch.from_numpy(_IMG_NORM_MEAN_NP).to(device=device, dtype=dtype or torch.float32)
+
+
+@functools.lru_cache(maxsize=None)
+def img_norm_std(device='cpu', dtype=None):
+    """Cached (1, 3, 1, 1) IMG_NORM_STD tensor, e.g. (...) / img_norm_std(x.device, x.dtype)."""
+    import torch
+    return torch.from_numpy(_IMG_NORM_STD_NP).to(device=device, dtype=dtype or torch.float32)
+
+
 """
 We create a superset of joints containing the OpenPose joints together with the ones that each dataset provides.
 We keep a superset of 24 joints such that we include all joints from every dataset.
@@ -74,10 +97,14 @@ COCO_KEYPOINTS = [
     'right_knee', 'left_ankle', 'right_ankle'
 ]
 
-# Dict containing the joints in numerical order
-JOINT_IDS = {JOINT_NAMES[i]: i for i in range(len(JOINT_NAMES))}
+# Frozen name -> index tables (JOINT_IDS, SMPLX_JOINT_IDS, joint_id(), *_ID ints),
+# generated by gen_joint_ids.py from the name lists in this file and lib/smplx/joint_names.py.
+# Only JOINT_IDS is checked at import; run gen_joint_ids.py --check to verify the rest
+from ._joint_ids_gen import *
+
+assert list(JOINT_IDS) == JOINT_NAMES, '_joint_ids_gen.py is stale, rerun gen_joint_ids.py'
 
-# Map joints to SMPL joints
+# Map joints to SMPL joints, kept for introspection (use JOINT_MAP_IDX on hot paths)
 JOINT_MAP = {
     'OP Nose': 24,
     'OP Neck': 12,
@@ -129,40 +156,40 @@ JOINT_MAP = {
     'Left Ear': 28,
     'Right Ear': 27
 }
+# SMPL joint index of every entry in JOINT_NAMES, i.e. [JOINT_MAP[i] for i in JOINT_NAMES]
+JOINT_MAP_IDX = np.fromiter((JOINT_MAP[n] for n in JOINT_NAMES), dtype=np.int64, count=len(JOINT_NAMES))
 
 # Joint selectors
 # Indices to get the 14 LSP joints from the 17 H36M joints
-H36M_TO_J17 = [6, 5, 4, 1, 2, 3, 16, 15, 14, 11, 12, 13, 8, 10, 0, 7, 9]
+H36M_TO_J17 = np.array([6, 5, 4, 1, 2, 3, 16, 15, 14, 11, 12, 13, 8, 10, 0, 7, 9], dtype=np.int64)
 H36M_TO_J14 = H36M_TO_J17[:14]
 # Indices to get the 14 LSP joints from the ground truth joints
-J24_TO_J17 = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 18, 14, 16, 17]
+J24_TO_J17 = np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 18, 14, 16, 17], dtype=np.int64)
 J24_TO_J14 = J24_TO_J17[:14]
-J24_TO_J19 = J24_TO_J17[:14] + [19, 20, 21, 22, 23]
+J24_TO_J19 = np.concatenate([J24_TO_J17[:14], np.arange(19, 24, dtype=np.int64)])
 # COCO with also 17 joints
-J24_TO_JCOCO = [19, 20, 21, 22, 23, 9, 8, 10, 7, 11, 6, 3, 2, 4, 1, 5, 0]
+J24_TO_JCOCO = np.array([19, 20, 21, 22, 23, 9, 8, 10, 7, 11, 6, 3, 2, 4, 1, 5, 0], dtype=np.int64)
 
 # Permutation of SMPL pose parameters when flipping the shape
-SMPL_JOINTS_FLIP_PERM = [
+SMPL_JOINTS_FLIP_PERM = np.array([
     0, 2, 1, 3, 5, 4, 6, 8, 7, 9, 11, 10, 12, 14, 13, 15, 17, 16, 19, 18, 21, 20, 23, 22
-]
-SMPL_POSE_FLIP_PERM = []
-for i in SMPL_JOINTS_FLIP_PERM:
-    SMPL_POSE_FLIP_PERM.append(3 * i)
-    SMPL_POSE_FLIP_PERM.append(3 * i + 1)
-    SMPL_POSE_FLIP_PERM.append(3 * i + 2)
+], dtype=np.int64)
+SMPL_POSE_FLIP_PERM = (SMPL_JOINTS_FLIP_PERM[:, None] * 3 +
+                       np.arange(3, dtype=np.int64)).reshape(-1)
 # Permutation indices for the 24 ground truth joints
-J24_FLIP_PERM = [
+J24_FLIP_PERM = np.array([
     5, 4, 3, 2, 1, 0, 11, 10, 9, 8, 7, 6, 12, 13, 14, 15, 16, 17, 18, 19, 21, 20, 23, 22
-]
+], dtype=np.int64)
 # Permutation indices for the full set of 49 joints
-J49_FLIP_PERM = [0, 1, 5, 6, 7, 2, 3, 4, 8, 12, 13, 14, 9, 10, 11, 16, 15, 18, 17, 22, 23, 24, 19, 20, 21]\
-              + [25+i for i in J24_FLIP_PERM]
-SMPL_J49_FLIP_PERM = [0, 1, 5, 6, 7, 2, 3, 4, 8, 12, 13, 14, 9, 10, 11, 16, 15, 18, 17, 22, 23, 24, 19, 20, 21]\
-              + [25+i for i in SMPL_JOINTS_FLIP_PERM]
+_OP_FLIP_PERM = np.array(
+    [0, 1, 5, 6, 7, 2, 3, 4, 8, 12, 13, 14, 9, 10, 11, 16, 15, 18, 17, 22, 23, 24, 19, 20, 21],
+    dtype=np.int64)
+J49_FLIP_PERM = np.concatenate([_OP_FLIP_PERM, 25 + J24_FLIP_PERM])
+SMPL_J49_FLIP_PERM = np.concatenate([_OP_FLIP_PERM, 25 + SMPL_JOINTS_FLIP_PERM])
 
-SMPLX2SMPL_J45 = [i for i in range(22)] + [30, 45] + [i for i in range(55, 55 + 21)]
+SMPLX2SMPL_J45 = np.concatenate([np.arange(22), [30, 45], np.arange(55, 55 + 21)]).astype(np.int64)
 
-SMPL_PART_ID = {
+SMPL_PART_ID = MappingProxyType({
     'rightHand': 1,
     'rightUpLeg': 2,
     'leftArm': 3,
@@ -187,7 +214,7 @@ SMPL_PART_ID = {
     'leftUpLeg': 22,
     'leftHand': 23,
     'hips': 24
-}
+})
 
 # MANO_NAMES = [
 #     'wrist',
@@ -232,10 +259,23 @@ HAND_NAMES = [
     'pinky',
 ]
 
-import lib.smplx.joint_names as smplx_joint_name
 
-SMPLX_JOINT_NAMES = smplx_joint_name.JOINT_NAMES
-SMPLX_JOINT_IDS = {SMPLX_JOINT_NAMES[i]: i for i in range(len(SMPLX_JOINT_NAMES))}
+def _smplx_joint_names():
+    import lib.smplx.joint_names as smplx_joint_name
+    return smplx_joint_name.JOINT_NAMES
+
+
+def __getattr__(name):
+    # SMPLX_JOINT_NAMES is resolved on first access (PEP 562), so importing constants does not
+    # initialize the lib.smplx package; SMPLX_JOINT_IDS comes from _joint_ids_gen and is only
+    # compared with these names here (or by gen_joint_ids.py --check), not on its own access
+    if name == 'SMPLX_JOINT_NAMES':
+        globals()[name] = _smplx_joint_names()
+        assert list(SMPLX_JOINT_IDS) == globals()[name], \
+            '_joint_ids_gen.py is stale, rerun gen_joint_ids.py'
+        return globals()[name]
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
 
 FOOT_NAMES = ['big_toe', 'small_toe', 'heel']
 
@@ -311,13 +351,13 @@ FACIAL_LANDMARKS = [
 ]
 
 # LRHAND_FLIP_PERM = [i for i in range(16, 32)] + [i for i in range(16)]
-LRHAND_FLIP_PERM = [i for i in range(len(HAND_NAMES),
-                                     len(HAND_NAMES) * 2)] + [i for i in range(len(HAND_NAMES))]
+LRHAND_FLIP_PERM = np.concatenate(
+    [np.arange(len(HAND_NAMES), 2 * len(HAND_NAMES)), np.arange(len(HAND_NAMES))]).astype(np.int64)
 
-SINGLE_HAND_FLIP_PERM = [i for i in range(len(HAND_NAMES))]
+SINGLE_HAND_FLIP_PERM = np.arange(len(HAND_NAMES), dtype=np.int64)
 
-FEEF_FLIP_PERM = [i for i in range(len(FOOT_NAMES),
-                                   len(FOOT_NAMES) * 2)] + [i for i in range(len(FOOT_NAMES))]
+FEEF_FLIP_PERM = np.concatenate(
+    [np.arange(len(FOOT_NAMES), 2 * len(FOOT_NAMES)), np.arange(len(FOOT_NAMES))]).astype(np.int64)
 
 # matchedParts = (
 #     [17, 26], [18, 25], [19, 24], [20, 23], [21, 22],
@@ -341,11 +381,31 @@ FEEF_FLIP_PERM = [i for i in range(len(FOOT_NAMES),
 #     [0, 16], [1, 15], [2, 14], [3, 13], [4, 12], [5, 11], [6, 10], [7, 9],[8],
 # )
 
-FACE_FLIP_PERM = [
+FACE_FLIP_PERM = np.array([
     9, 8, 7, 6, 5, 4, 3, 2, 1, 0, 10, 11, 12, 13, 18, 17, 16, 15, 14, 28, 27, 26, 25, 30, 29, 22,
     21, 20, 19, 24, 23, 37, 36, 35, 34, 33, 32, 31, 42, 41, 40, 39, 38, 47, 46, 45, 44, 43, 50, 49,
-    48
-]
-FACE_FLIP_PERM = FACE_FLIP_PERM + [
+    48,
+    # face contour
     67, 66, 65, 64, 63, 62, 61, 60, 59, 58, 57, 56, 55, 54, 53, 52, 51
-]
+], dtype=np.int64)
+
+# Joint selectors and flip permutations above are int64 index arrays, so indexing an
+# ndarray / tensor with them does not convert a Python list on every call; these are
+# the names perm_tensor() serves
+_INDEX_ARRAY_NAMES = (
+    'H36M_TO_J17', 'H36M_TO_J14', 'J24_TO_J17', 'J24_TO_J14', 'J24_TO_J19', 'J24_TO_JCOCO',
+    'JOINT_MAP_IDX', 'SMPLX2SMPL_J45', 'SMPL_JOINTS_FLIP_PERM', 'SMPL_POSE_FLIP_PERM',
+    'J24_FLIP_PERM', 'J49_FLIP_PERM', 'SMPL_J49_FLIP_PERM', 'LRHAND_FLIP_PERM',
+    'SINGLE_HAND_FLIP_PERM', 'FEEF_FLIP_PERM', 'FACE_FLIP_PERM'
+)
+
+
+@functools.lru_cache(maxsize=None)
+def perm_tensor(name, device='cpu'):
+    """Cached LongTensor of an index array above, e.g. perm_tensor('J24_TO_J19', x.device)."""
+    import torch
+
+    if name not in _INDEX_ARRAY_NAMES:
+        raise KeyError('{} is not an index array in constants'.format(name))
+    # copy, so the cached tensor never aliases the module-level array
+    return torch.tensor(globals()[name], dtype=torch.long, device=device)
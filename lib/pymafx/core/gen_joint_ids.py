@@ -0,0 +1,110 @@
+"""
+Emit _joint_ids_gen.py, the frozen name -> index tables re-exported by constants.py.
+Rerun after editing any of the joint name lists:
+
+    python -m lib.pymafx.core.gen_joint_ids
+
+constants.py only checks JOINT_IDS at import; pass --check to verify the whole file,
+including SMPLX_JOINT_IDS against lib/smplx/joint_names.py, without rewriting it.
+"""
+
+import ast
+import os
+import re
+import sys
+
+CORE_DIR = os.path.dirname(os.path.abspath(__file__))
+OUT_PATH = os.path.join(CORE_DIR, '_joint_ids_gen.py')
+CONSTANTS_PATH = os.path.join(CORE_DIR, 'constants.py')
+SMPLX_JOINT_NAMES_PATH = os.path.join(CORE_DIR, '..', '..', 'smplx', 'joint_names.py')
+
+
+def read_literal(path, name):
+    # parse the source instead of importing it, so constants.py (which star-imports the
+    # generated file) and the torch-backed lib.smplx package are never executed
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+                isinstance(t, ast.Name) and t.id == name for t in node.targets):
+            value = node.value
+            if isinstance(value, ast.Call):  # e.g. MappingProxyType({...})
+                value = value.args[0]
+            return ast.literal_eval(value)
+    raise KeyError('{} is not assigned in {}'.format(name, path))
+
+
+def to_identifier(name, prefix=''):
+    # 'OP RShoulder' -> OP_RSHOULDER, 'Neck (LSP)' -> NECK_LSP, 'leftHandIndex1' -> LEFT_HAND_INDEX1
+    name = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', name) if ' ' not in name else name
+    name = re.sub(r'\W+', '_', name).strip('_').upper()
+    return '{}{}_ID'.format(prefix, name)
+
+
+def _emit_mapping(lines, var, names):
+    lines.append('_{} = {{'.format(var))
+    for i, name in enumerate(names):
+        lines.append('    {!r}: {},'.format(name, i))
+    lines.append('}')
+    lines.append('{0} = MappingProxyType(_{0})'.format(var))
+    lines.append('')
+
+
+def _emit_constants(lines, items, prefix=''):
+    exported = []
+    for name, idx in items:
+        ident = to_identifier(name, prefix)
+        assert ident not in exported, 'duplicate joint identifier {}'.format(ident)
+        lines.append('{}: Final[int] = {}'.format(ident, idx))
+        exported.append(ident)
+    lines.append('')
+    return exported
+
+
+def generate(joint_names, smplx_joint_names, smpl_part_id):
+    lines = [
+        '# This file is generated by gen_joint_ids.py, do not edit it by hand.',
+        'from types import MappingProxyType',
+        'from typing import Final',
+        '',
+        'import numpy as np',
+        '',
+        '# Dict containing the joints in numerical order',
+    ]
+    _emit_mapping(lines, 'JOINT_IDS', joint_names)
+    lines.append('# Dict containing the SMPL-X joints in numerical order')
+    _emit_mapping(lines, 'SMPLX_JOINT_IDS', smplx_joint_names)
+
+    # dict.__getitem__ bound to the backing dict skips the proxy indirection
+    lines.append('joint_id = _JOINT_IDS.__getitem__')
+    lines.append('smplx_joint_id = _SMPLX_JOINT_IDS.__getitem__')
+    lines.append('')
+
+    lines.append('JOINT_ID_ARRAY = np.array({}, dtype=np.int32)'.format(list(range(len(joint_names)))))
+    lines.append('')
+
+    exported = ['JOINT_IDS', 'SMPLX_JOINT_IDS', 'joint_id', 'smplx_joint_id', 'JOINT_ID_ARRAY']
+    exported += _emit_constants(lines, [(n, i) for i, n in enumerate(joint_names)])
+    exported += _emit_constants(lines, [(n, i) for i, n in enumerate(smplx_joint_names)], 'SMPLX_')
+    exported += _emit_constants(lines, list(smpl_part_id.items()), 'SMPL_PART_')
+
+    lines.append('__all__ = [')
+    lines += ['    {!r},'.format(name) for name in exported]
+    lines.append(']')
+    return '\n'.join(lines) + '\n'
+
+
+if __name__ == '__main__':
+    joint_names = read_literal(CONSTANTS_PATH, 'OP_JOINT_NAMES') + read_literal(
+        CONSTANTS_PATH, 'SPIN_JOINT_NAMES')
+    source = generate(
+        joint_names, read_literal(SMPLX_JOINT_NAMES_PATH, 'JOINT_NAMES'),
+        read_literal(CONSTANTS_PATH, 'SMPL_PART_ID')
+    )
+    if '--check' in sys.argv[1:]:
+        with open(OUT_PATH) as f:
+            if f.read() != source:
+                sys.exit('{} is stale, rerun gen_joint_ids.py'.format(OUT_PATH))
+    else:
+        with open(OUT_PATH, 'w') as f:
+            f.write(source)
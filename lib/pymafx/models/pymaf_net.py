@@ -619,7 +619,7 @@ class Regressor(nn.Module):
             if J_regressor is not None:
                 kp_3d = torch.matmul(J_regressor, pred_vertices)
                 pred_pelvis = kp_3d[:, [0], :].clone()
-                kp_3d = kp_3d[:, constants.H36M_TO_J14, :]
+                kp_3d = kp_3d[:, constants.perm_tensor('H36M_TO_J14', kp_3d.device), :]
                 kp_3d = kp_3d - pred_pelvis
             else:
                 kp_3d = pred_joints
@@ -40,10 +40,8 @@ class SMPL(_SMPL):
                          create_global_orient=create_global_orient, 
                          create_body_pose=create_body_pose, 
                          create_transl=create_transl, *args, **kwargs)
-        joints = [constants.JOINT_MAP[i] for i in constants.JOINT_NAMES]
         J_regressor_extra = np.load(path_config.JOINT_REGRESSOR_TRAIN_EXTRA)
         self.register_buffer('J_regressor_extra', torch.tensor(J_regressor_extra, dtype=torch.float32))
-        self.joint_map = torch.tensor(joints, dtype=torch.long)
         # self.ModelOutput = namedtuple('ModelOutput_', ModelOutput._fields + ('smpl_joints', 'joints_J19',))
         # self.ModelOutput.__new__.__defaults__ = (None,) * len(self.ModelOutput._fields)
 
@@ -58,9 +56,9 @@ class SMPL(_SMPL):
         vertices = smpl_output.vertices
         joints = torch.cat([smpl_output.joints, extra_joints], dim=1)
         smpl_joints = smpl_output.joints[:, :24]
-        joints = joints[:, self.joint_map, :]   # [B, 49, 3]
+        joints = joints[:, constants.perm_tensor('JOINT_MAP_IDX', joints.device), :]   # [B, 49, 3]
         joints_J24 = joints[:, -24:, :]
-        joints_J19 = joints_J24[:, constants.J24_TO_J19, :]
+        joints_J19 = joints_J24[:, constants.perm_tensor('J24_TO_J19', joints.device), :]
         output = ModelOutput(vertices=vertices,
                              global_orient=smpl_output.global_orient,
                              body_pose=smpl_output.body_pose,
@@ -316,10 +314,8 @@ class SMPLX_ALL(nn.Module):
                                                         use_pca=False, batch_size=batch_size, use_face_contour=use_face_contour, num_pca_comps=45, **kwargs)
                                           for gender in self.genders})
         self.model_neutral = self.model_dict['neutral']
-        joints = [constants.JOINT_MAP[i] for i in constants.JOINT_NAMES]
         J_regressor_extra = np.load(path_config.JOINT_REGRESSOR_TRAIN_EXTRA)
         self.register_buffer('J_regressor_extra', torch.tensor(J_regressor_extra, dtype=torch.float32))
-        self.joint_map = torch.tensor(joints, dtype=torch.long)
         # smplx_to_smpl.pkl, file source: https://smpl-x.is.tue.mpg.de
         smplx_to_smpl = pickle.load(open(os.path.join(SMPL_MODEL_DIR, 'model_transfer/smplx_to_smpl.pkl'), 'rb'))    
         self.register_buffer('smplx2smpl', torch.tensor(smplx_to_smpl['matrix'][None], dtype=torch.float32))
@@ -403,12 +399,12 @@ class SMPLX_ALL(nn.Module):
         rhand_vertices = smpl_vertices[:, self.smpl2rhand]
         extra_joints = vertices2joints(self.J_regressor_extra, smpl_vertices)
         # smpl_output.joints: [B, 45, 3]  extra_joints: [B, 9, 3]
-        smplx_j45 = smplx_joints[:, constants.SMPLX2SMPL_J45]
+        smplx_j45 = smplx_joints[:, constants.perm_tensor('SMPLX2SMPL_J45', smplx_joints.device)]
         joints = torch.cat([smplx_j45, extra_joints], dim=1)
         smpl_joints = smplx_j45[:, :24]
-        joints = joints[:, self.joint_map, :]   # [B, 49, 3]
+        joints = joints[:, constants.perm_tensor('JOINT_MAP_IDX', joints.device), :]   # [B, 49, 3]
         joints_J24 = joints[:, -24:, :]
-        joints_J19 = joints_J24[:, constants.J24_TO_J19, :]
+        joints_J19 = joints_J24[:, constants.perm_tensor('J24_TO_J19', joints.device), :]
         output = ModelOutput(vertices=smpl_vertices,
                              smplx_vertices=smplx_vertices,
                              lhand_vertices=lhand_vertices,
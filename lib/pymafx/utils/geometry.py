@@ -2,30 +2,55 @@ import torch
 from torch.nn import functional as F
 import numpy as np
 import numbers
-from einops.einops import rearrange
 """
 Useful geometric operations, e.g. Perspective projection and a differentiable Rodrigues formula
 Parts of the code are taken from https://github.com/MandyMo/pytorch_HMR
 """
 
+# (1, 3, 3) identity per (device, dtype), expanded as a view instead of re-allocated per call
+_EYE3_CACHE = {}
+
+
+def _get_eye3(device, dtype=torch.float32):
+    key = (torch.device(device), dtype)
+    if key not in _EYE3_CACHE:
+        _EYE3_CACHE[key] = torch.eye(3, dtype=dtype, device=device).unsqueeze(0)
+    return _EYE3_CACHE[key]
+
 
 def batch_rodrigues(theta):
     """Convert axis-angle representation to rotation matrix.
     Args:
         theta: size = [B, 3]
     Returns:
-        Rotation matrix corresponding to the quaternion -- size = [B, 3, 3]
+        Rotation matrix corresponding to the axis-angle -- size = [B, 3, 3]
     """
-    l1norm = torch.norm(theta + 1e-8, p=2, dim=1)
-    angle = torch.unsqueeze(l1norm, -1)
-    normalized = torch.div(theta, angle)
-    angle = angle * 0.5
-    v_cos = torch.cos(angle)
-    v_sin = torch.sin(angle)
-    quat = torch.cat([v_cos, v_sin * normalized], dim=1)
-    return quat_to_rotmat(quat)
-
-
+    # R = I + sin(angle) * K + (1 - cos(angle)) * K @ K, with K the skew matrix of the unit axis
+    B = theta.shape[0]
+    angle = theta.norm(p=2, dim=1, keepdim=True).clamp_min(1e-8)
+    kx, ky, kz = torch.unbind(theta / angle, dim=1)
+    zeros = torch.zeros_like(kx)
+    K = torch.stack([zeros, -kz, ky, kz, zeros, -kx, -ky, kx, zeros], dim=1).view(B, 3, 3)
+
+    v_sin = torch.sin(angle).unsqueeze(-1)
+    v_cos = torch.cos(angle).unsqueeze(-1)
+    eye = _get_eye3(theta.device, theta.dtype)
+    return torch.baddbmm(eye + v_sin * K, (1. - v_cos) * K, K)
+
+
+@torch.jit.script
+def _normalize_quat(quat, eps: float = 1e-12):
+    # scale by max |q_i| before squaring so the norm neither under- nor overflows;
+    # (near-)zero quaternions fall back to the identity, as batch_rodrigues does for a zero angle
+    m = quat.abs().amax(dim=1, keepdim=True)
+    safe_m = m.clamp_min(eps)
+    inv = (quat / safe_m).pow(2).sum(1, keepdim=True).clamp_min(eps).rsqrt()
+    identity = torch.cat([torch.ones_like(m), torch.zeros_like(quat[:, 1:])], dim=1)
+    # test m <= eps rather than m > eps so NaN quaternions propagate instead of becoming identity
+    return torch.where(m <= eps, identity, quat * (inv / safe_m))
+
+
+@torch.jit.script
 def quat_to_rotmat(quat):
     """Convert quaternion coefficients to rotation matrix.
     Args:
@@ -33,8 +58,7 @@ def quat_to_rotmat(quat):
     Returns:
         Rotation matrix corresponding to the quaternion -- size = [B, 3, 3]
     """
-    norm_quat = quat
-    norm_quat = norm_quat / norm_quat.norm(p=2, dim=1, keepdim=True)
+    norm_quat = _normalize_quat(quat)
     w, x, y, z = norm_quat[:, 0], norm_quat[:, 1], norm_quat[:, 2], norm_quat[:, 3]
 
     B = quat.size(0)
@@ -64,23 +88,17 @@ def rotation_matrix_to_angle_axis(rotation_matrix):
         Tensor: Rodrigues vector transformation.
 
     Shape:
-        - Input: :math:`(N, 3, 4)`
+        - Input: :math:`(N, 3, 4)` or :math:`(N, 3, 3)`
         - Output: :math:`(N, 3)`
 
     Example:
         >>> input = torch.rand(2, 3, 4)  # Nx4x4
         >>> output = tgm.rotation_matrix_to_angle_axis(input)  # Nx3
     """
-    if rotation_matrix.shape[1:] == (3, 3):
-        rot_mat = rotation_matrix.reshape(-1, 3, 3)
-        hom = torch.tensor([0, 0, 1], dtype=torch.float32, device=rotation_matrix.device).reshape(
-            1, 3, 1).expand(rot_mat.shape[0], -1, -1)
-        rotation_matrix = torch.cat([rot_mat, hom], dim=-1)
-
+    # only the 3x3 block is read by rotation_matrix_to_quaternion, so (N, 3, 3) is passed as is
     quaternion = rotation_matrix_to_quaternion(rotation_matrix)
     aa = quaternion_to_angle_axis(quaternion)
-    aa[torch.isnan(aa)] = 0.0
-    return aa
+    return torch.nan_to_num(aa, nan=0.0)
 
 
 def quaternion_to_angle_axis(quaternion: torch.Tensor) -> torch.Tensor:
@@ -111,6 +129,11 @@ def quaternion_to_angle_axis(quaternion: torch.Tensor) -> torch.Tensor:
     if not quaternion.shape[-1] == 4:
         raise ValueError("Input must be a tensor of shape Nx4 or 4. Got {}".format(
             quaternion.shape))
+    return _quaternion_to_angle_axis(quaternion)
+
+
+@torch.jit.script
+def _quaternion_to_angle_axis(quaternion):
     # unpack input and compute conversion
     q1: torch.Tensor = quaternion[..., 1]
     q2: torch.Tensor = quaternion[..., 2]
@@ -126,10 +149,7 @@ def quaternion_to_angle_axis(quaternion: torch.Tensor) -> torch.Tensor:
     k_neg: torch.Tensor = 2.0 * torch.ones_like(sin_theta)
     k: torch.Tensor = torch.where(sin_squared_theta > 0.0, k_pos, k_neg)
 
-    angle_axis: torch.Tensor = torch.zeros_like(quaternion)[..., :3]
-    angle_axis[..., 0] += q1 * k
-    angle_axis[..., 1] += q2 * k
-    angle_axis[..., 2] += q3 * k
+    angle_axis: torch.Tensor = torch.stack([q1 * k, q2 * k, q3 * k], dim=-1)
     return angle_axis
 
 
@@ -191,7 +211,7 @@ def rotation_matrix_to_quaternion(rotation_matrix, eps=1e-6):
         Tensor: the rotation in quaternion
 
     Shape:
-        - Input: :math:`(N, 3, 4)`
+        - Input: :math:`(N, 3, 4)` or :math:`(N, 3, 3)`
         - Output: :math:`(N, 4)`
 
     Example:
@@ -209,6 +229,12 @@ def rotation_matrix_to_quaternion(rotation_matrix, eps=1e-6):
     #         "Input size must be a N x 3 x 4  tensor. Got {}".format(
     #             rotation_matrix.shape))
 
+    return _rotation_matrix_to_quaternion(rotation_matrix.contiguous(), eps)
+
+
+@torch.jit.script
+def _rotation_matrix_to_quaternion(rotation_matrix, eps: float):
+    # scripted body of rotation_matrix_to_quaternion, so the four candidate branches fuse
     rmat_t = torch.transpose(rotation_matrix, 1, 2)
 
     mask_d2 = rmat_t[:, 2, 2] < eps
@@ -221,42 +247,34 @@ def rotation_matrix_to_quaternion(rotation_matrix, eps=1e-6):
         rmat_t[:, 1, 2] - rmat_t[:, 2, 1], t0, rmat_t[:, 0, 1] + rmat_t[:, 1, 0],
         rmat_t[:, 2, 0] + rmat_t[:, 0, 2]
     ], -1)
-    t0_rep = t0.repeat(4, 1).t()
 
     t1 = 1 - rmat_t[:, 0, 0] + rmat_t[:, 1, 1] - rmat_t[:, 2, 2]
     q1 = torch.stack([
         rmat_t[:, 2, 0] - rmat_t[:, 0, 2], rmat_t[:, 0, 1] + rmat_t[:, 1, 0], t1,
         rmat_t[:, 1, 2] + rmat_t[:, 2, 1]
     ], -1)
-    t1_rep = t1.repeat(4, 1).t()
 
     t2 = 1 - rmat_t[:, 0, 0] - rmat_t[:, 1, 1] + rmat_t[:, 2, 2]
     q2 = torch.stack([
         rmat_t[:, 0, 1] - rmat_t[:, 1, 0], rmat_t[:, 2, 0] + rmat_t[:, 0, 2],
         rmat_t[:, 1, 2] + rmat_t[:, 2, 1], t2
     ], -1)
-    t2_rep = t2.repeat(4, 1).t()
 
     t3 = 1 + rmat_t[:, 0, 0] + rmat_t[:, 1, 1] + rmat_t[:, 2, 2]
     q3 = torch.stack([
         t3, rmat_t[:, 1, 2] - rmat_t[:, 2, 1], rmat_t[:, 2, 0] - rmat_t[:, 0, 2],
         rmat_t[:, 0, 1] - rmat_t[:, 1, 0]
     ], -1)
-    t3_rep = t3.repeat(4, 1).t()
-
-    mask_c0 = mask_d2 * mask_d0_d1
-    mask_c1 = mask_d2 * ~mask_d0_d1
-    mask_c2 = ~mask_d2 * mask_d0_nd1
-    mask_c3 = ~mask_d2 * ~mask_d0_nd1
-    mask_c0 = mask_c0.view(-1, 1).type_as(q0)
-    mask_c1 = mask_c1.view(-1, 1).type_as(q1)
-    mask_c2 = mask_c2.view(-1, 1).type_as(q2)
-    mask_c3 = mask_c3.view(-1, 1).type_as(q3)
-
-    q = q0 * mask_c0 + q1 * mask_c1 + q2 * mask_c2 + q3 * mask_c3
-    q /= torch.sqrt(t0_rep * mask_c0 + t1_rep * mask_c1 +  # noqa
-                    t2_rep * mask_c2 + t3_rep * mask_c3)  # noqa
-    q *= 0.5
+
+    # pick one branch per row, the remaining case falls through to q3 / t3
+    sel0 = mask_d2 & mask_d0_d1
+    sel1 = mask_d2 & ~mask_d0_d1
+    sel2 = ~mask_d2 & mask_d0_nd1
+
+    t = torch.where(sel0, t0, torch.where(sel1, t1, torch.where(sel2, t2, t3)))
+    sel0, sel1, sel2 = sel0.unsqueeze(-1), sel1.unsqueeze(-1), sel2.unsqueeze(-1)
+    q = torch.where(sel0, q0, torch.where(sel1, q1, torch.where(sel2, q2, q3)))
+    q = q * (0.5 * torch.rsqrt(t)).unsqueeze(-1)
     return q
 
 
@@ -278,37 +296,15 @@ def euler_to_quaternion(r):
     sy = torch.sin(y)
     cx = torch.cos(x)
     sx = torch.sin(x)
-    quaternion = torch.zeros_like(r.repeat(1, 2))[..., :4].to(r.device)
-    quaternion[..., 0] += cx * cy * cz - sx * sy * sz
-    quaternion[..., 1] += cx * sy * sz + cy * cz * sx
-    quaternion[..., 2] += cx * cz * sy - sx * cy * sz
-    quaternion[..., 3] += cx * cy * sz + sx * cz * sy
+    quaternion = torch.stack([
+        cx * cy * cz - sx * sy * sz, cx * sy * sz + cy * cz * sx, cx * cz * sy - sx * cy * sz,
+        cx * cy * sz + sx * cz * sy
+    ], dim=-1)
     return quaternion
 
 
-def quaternion_to_rotation_matrix(quat):
-    """Convert quaternion coefficients to rotation matrix.
-    Args:
-        quat: size = [B, 4] 4 <===>(w, x, y, z)
-    Returns:
-        Rotation matrix corresponding to the quaternion -- size = [B, 3, 3]
-    """
-    norm_quat = quat
-    norm_quat = norm_quat / norm_quat.norm(p=2, dim=1, keepdim=True)
-    w, x, y, z = norm_quat[:, 0], norm_quat[:, 1], norm_quat[:, 2], norm_quat[:, 3]
-
-    B = quat.size(0)
-
-    w2, x2, y2, z2 = w.pow(2), x.pow(2), y.pow(2), z.pow(2)
-    wx, wy, wz = w * x, w * y, w * z
-    xy, xz, yz = x * y, x * z, y * z
-
-    rotMat = torch.stack([
-        w2 + x2 - y2 - z2, 2 * xy - 2 * wz, 2 * wy + 2 * xz, 2 * wz + 2 * xy, w2 - x2 + y2 - z2,
-        2 * yz - 2 * wx, 2 * xz - 2 * wy, 2 * wx + 2 * yz, w2 - x2 - y2 + z2
-    ],
-                         dim=1).view(B, 3, 3)
-    return rotMat
+# same conversion as quat_to_rotmat, kept under both names
+quaternion_to_rotation_matrix = quat_to_rotmat
 
 
 def rot6d_to_rotmat(x):
@@ -319,35 +315,28 @@ def rot6d_to_rotmat(x):
     Output:
         (B,3,3) Batch of corresponding rotation matrices
     """
-    if x.shape[-1] == 6:
-        batch_size = x.shape[0]
-        if len(x.shape) == 3:
-            num = x.shape[1]
-            x = rearrange(x, 'b n d -> (b n) d', d=6)
-        else:
-            num = 1
-        x = rearrange(x, 'b (k l) -> b k l', k=3, l=2)
-        # x = x.view(-1,3,2)
-        a1 = x[:, :, 0]
-        a2 = x[:, :, 1]
-        b1 = F.normalize(a1)
-        b2 = F.normalize(a2 - torch.einsum('bi,bi->b', b1, a2).unsqueeze(-1) * b1)
-        b3 = torch.cross(b1, b2, dim=-1)
-
-        mat = torch.stack((b1, b2, b3), dim=-1)
-        if num > 1:
-            mat = rearrange(mat, '(b n) h w-> b n h w', b=batch_size, n=num, h=3, w=3)
-    else:
-        x = x.view(-1, 3, 2)
-        a1 = x[:, :, 0]
-        a2 = x[:, :, 1]
-        b1 = F.normalize(a1)
-        b2 = F.normalize(a2 - torch.einsum('bi,bi->b', b1, a2).unsqueeze(-1) * b1)
-        b3 = torch.cross(b1, b2, dim=-1)
-        mat = torch.stack((b1, b2, b3), dim=-1)
+    mat = _rot6d_to_rotmat(x.reshape(-1, 3, 2))
+    if x.shape[-1] == 6 and len(x.shape) == 3 and x.shape[1] > 1:
+        mat = mat.view(x.shape[0], x.shape[1], 3, 3)
     return mat
 
 
+@torch.jit.script
+def _rot6d_to_rotmat(x):
+    # x: (B, 3, 2), Gram-Schmidt on the two columns; clamp matches F.normalize(eps=1e-12)
+    a1 = x[:, :, 0]
+    a2 = x[:, :, 1]
+    b1 = a1 * a1.square().sum(-1, keepdim=True).clamp_min(1e-24).rsqrt()
+    b2 = a2 - (b1 * a2).sum(-1, keepdim=True) * b1
+    b2 = b2 * b2.square().sum(-1, keepdim=True).clamp_min(1e-24).rsqrt()
+    # b1 x b2 written out so it fuses with the normalization above
+    b3 = torch.stack([
+        b1[:, 1] * b2[:, 2] - b1[:, 2] * b2[:, 1], b1[:, 2] * b2[:, 0] - b1[:, 0] * b2[:, 2],
+        b1[:, 0] * b2[:, 1] - b1[:, 1] * b2[:, 0]
+    ], dim=-1)
+    return torch.stack((b1, b2, b3), dim=-1)
+
+
 def rotmat_to_rot6d(x):
     """Convert 3x3 rotation matrix to 6D rotation representation.
     Based on Zhou et al., "On the Continuity of Rotation Representations in Neural Networks", CVPR 2019
@@ -385,13 +374,15 @@ def projection(pred_joints, pred_camera, retain_z=False, iwp_mode=True):
     batch_size = pred_joints.shape[0]
     if iwp_mode:
         cam_sxy = pred_camera['cam_sxy']
-        pred_cam_t = torch.stack(
-            [cam_sxy[:, 1], cam_sxy[:, 2], 2 * 5000. / (224. * cam_sxy[:, 0] + 1e-9)], dim=-1)
+        # (tx, ty, 2 * focal / (res * s)) with focal = 5000 and res = 224
+        pred_cam_t = torch.empty(batch_size, 3, dtype=cam_sxy.dtype, device=cam_sxy.device)
+        pred_cam_t[:, :2] = cam_sxy[:, 1:3]
+        pred_cam_t[:, 2] = 10000. / (224. * cam_sxy[:, 0] + 1e-9)
 
-        camera_center = torch.zeros(batch_size, 2)
+        camera_center = torch.zeros(batch_size, 2, device=pred_joints.device)
+        rotation = _get_eye3(pred_joints.device, pred_joints.dtype).expand(batch_size, -1, -1)
         pred_keypoints_2d = perspective_projection(pred_joints,
-                                                   rotation=torch.eye(3).unsqueeze(0).expand(
-                                                       batch_size, -1, -1).to(pred_joints.device),
+                                                   rotation=rotation,
                                                    translation=pred_cam_t,
                                                    focal_length=5000.,
                                                    camera_center=camera_center,
@@ -443,37 +434,63 @@ def perspective_projection(points,
         focal_length (bs,) or scalar: Focal length
         camera_center (bs, 2): Camera center
     """
-    batch_size = points.shape[0]
+    # Transform points, R @ X + t for every point
+    points = torch.baddbmm(translation.unsqueeze(1), points, rotation.transpose(1, 2))
+
     if cam_intrinsics is not None:
-        K = cam_intrinsics
-    else:
-        # raise
-        K = torch.zeros([batch_size, 3, 3], device=points.device)
-        K[:, 0, 0] = focal_length
-        K[:, 1, 1] = focal_length
-        K[:, 2, 2] = 1.
-        K[:, :-1, -1] = camera_center
+        # Apply perspective distortion
+        projected_points = points / points[:, :, -1].unsqueeze(-1)
 
-    # Transform points
-    points = torch.einsum('bij,bkj->bki', rotation, points)
-    points = points + translation.unsqueeze(1)
+        # Apply camera intrinsics
+        projected_points = torch.bmm(projected_points, cam_intrinsics.transpose(1, 2))
 
-    # Apply perspective distortion
-    projected_points = points / points[:, :, -1].unsqueeze(-1)
+        if retain_z:
+            return projected_points
+        else:
+            return projected_points[:, :, :-1]
 
-    # Apply camera intrinsics
-    projected_points = torch.einsum('bij,bkj->bki', K, projected_points)
+    # K = [[f, 0, cx], [0, f, cy], [0, 0, 1]], so apply it pointwise: u = f * x / z + cx
+    focal_length = torch.as_tensor(focal_length, dtype=points.dtype,
+                                   device=points.device).reshape(-1, 1, 1)
+    camera_center = torch.as_tensor(camera_center, dtype=points.dtype, device=points.device)
+    inv_z = 1. / points[:, :, -1:]
+    projected_points = points[:, :, :-1] * (focal_length * inv_z) + camera_center.reshape(-1, 1, 2)
 
     if retain_z:
-        return projected_points
+        return torch.cat([projected_points, torch.ones_like(inv_z)], dim=-1)
     else:
-        return projected_points[:, :, :-1]
+        return projected_points
 
 
 def convert_to_full_img_cam(pare_cam, bbox_height, bbox_center, img_w, img_h, focal_length):
     # Converts weak perspective camera estimated by PARE in
     # bbox coords to perspective camera in full image coordinates
     # from https://arxiv.org/pdf/2009.06549.pdf
+    if torch.is_tensor(pare_cam):
+        bbox_height, bbox_center, img_w, img_h, focal_length = [
+            torch.as_tensor(v, dtype=pare_cam.dtype, device=pare_cam.device)
+            for v in (bbox_height, bbox_center, img_w, img_h, focal_length)
+        ]
+        return _convert_to_full_img_cam_torch(pare_cam, bbox_height, bbox_center, img_w, img_h,
+                                              focal_length)
+    return _convert_to_full_img_cam_numpy(pare_cam, bbox_height, bbox_center, img_w, img_h,
+                                          focal_length)
+
+
+@torch.jit.script
+def _convert_to_full_img_cam_torch(pare_cam, bbox_height, bbox_center, img_w, img_h,
+                                   focal_length):
+    s, tx, ty = pare_cam[:, 0], pare_cam[:, 1], pare_cam[:, 2]
+    # tz = 2 * f / (r * res * s) with r = bbox_height / res, so all three terms share 1 / (s * h)
+    inv_sb = 1.0 / (s * bbox_height)
+    tz = 2 * focal_length * inv_sb
+    cx = 2 * (bbox_center[:, 0] - (img_w / 2.)) * inv_sb
+    cy = 2 * (bbox_center[:, 1] - (img_h / 2.)) * inv_sb
+    return torch.stack([tx + cx, ty + cy, tz], dim=-1)
+
+
+def _convert_to_full_img_cam_numpy(pare_cam, bbox_height, bbox_center, img_w, img_h,
+                                   focal_length):
     s, tx, ty = pare_cam[:, 0], pare_cam[:, 1], pare_cam[:, 2]
     res = 224
     r = bbox_height / res
@@ -482,12 +499,7 @@ def convert_to_full_img_cam(pare_cam, bbox_height, bbox_center, img_w, img_h, fo
     cx = 2 * (bbox_center[:, 0] - (img_w / 2.)) / (s * bbox_height)
     cy = 2 * (bbox_center[:, 1] - (img_h / 2.)) / (s * bbox_height)
 
-    if torch.is_tensor(pare_cam):
-        cam_t = torch.stack([tx + cx, ty + cy, tz], dim=-1)
-    else:
-        cam_t = np.stack([tx + cx, ty + cy, tz], axis=-1)
-
-    return cam_t
+    return np.stack([tx + cx, ty + cy, tz], axis=-1)
 
 
 def estimate_translation_np(S, joints_2d, joints_conf, focal_length=5000, img_size=(224., 224.)):
@@ -534,6 +546,46 @@ def estimate_translation_np(S, joints_2d, joints_conf, focal_length=5000, img_si
     return trans
 
 
+def estimate_translation_batch(S, joints_2d, joints_conf, focal_length=5000., img_size=(224., 224.)):
+    """Batched estimate_translation_np, solved with torch on S.device.
+    Input:
+        S: (B, N, 3) 3D joint locations
+        joints_2d: (B, N, 2) 2D joint locations
+        joints_conf: (B, N) 2D joint confidence
+        focal_length: scalar or (B,)
+        img_size: (h, w) or (B, 2)
+    Returns:
+        (B, 3) camera translation vectors
+    """
+    batch_size, num_joints = S.shape[:2]
+    # focal length (B, N) and optical center (B, 1, 2) in (x, y) order
+    f = torch.as_tensor(focal_length, dtype=S.dtype, device=S.device).reshape(-1, 1)
+    f = f.expand(batch_size, num_joints)
+    img_size = torch.as_tensor(img_size, dtype=S.dtype, device=S.device).reshape(-1, 1, 2)
+    center = img_size.flip(-1) / 2.
+
+    # least squares, rows ordered (x0, y0, x1, y1, ...) as in estimate_translation_np
+    zeros = torch.zeros_like(f)
+    Q = torch.stack([
+        torch.stack([f, zeros], dim=-1).reshape(batch_size, 2 * num_joints),
+        torch.stack([zeros, f], dim=-1).reshape(batch_size, 2 * num_joints),
+        (center - joints_2d).reshape(batch_size, 2 * num_joints)
+    ], dim=-1)
+    c = ((joints_2d - center) * S[:, :, 2:] - f.unsqueeze(-1) * S[:, :, :2]).reshape(
+        batch_size, 2 * num_joints, 1)
+
+    # weighted least squares, row scaling is W @ Q without building the diagonal W
+    weight2 = joints_conf.sqrt().repeat_interleave(2, dim=1).unsqueeze(-1)
+    Q = Q * weight2
+    c = c * weight2
+
+    # square matrix
+    Qt = Q.transpose(1, 2)
+    trans = torch.linalg.solve(torch.bmm(Qt, Q), torch.bmm(Qt, c)).squeeze(-1)
+
+    return trans
+
+
 def estimate_translation(S, joints_2d, focal_length=5000., img_size=224., use_all_kps=False):
     """Find camera translation that brings 3D joints S closest to 2D the corresponding joints_2d.
     Input:
@@ -542,40 +594,38 @@ def estimate_translation(S, joints_2d, focal_length=5000., img_size=224., use_al
     Returns:
         (B, 3) camera translation vectors
     """
-    if isinstance(focal_length, numbers.Number):
-        focal_length = [
-            focal_length,
-        ] * S.shape[0]
-        # print(len(focal_length), focal_length)
-
+    if not use_all_kps:
+        # Use only joints 25:49 (GT joints)
+        S = S[:, 25:, :]
+        joints_2d = joints_2d[:, 25:, :]
     if isinstance(img_size, numbers.Number):
-        img_size = [
-            (img_size, img_size),
-        ] * S.shape[0]
-        # print(len(img_size), img_size)
-
-    device = S.device
-    if use_all_kps:
-        S = S.cpu().numpy()
-        joints_2d = joints_2d.cpu().numpy()
+        img_size = (img_size, img_size)
+    # solve in double precision, as estimate_translation_np does on the CPU
+    S = S.detach().double()
+    joints_2d = joints_2d.detach().double()
+    trans = estimate_translation_batch(S,
+                                       joints_2d[:, :, :-1],
+                                       joints_2d[:, :, -1],
+                                       focal_length=focal_length,
+                                       img_size=img_size)
+    return trans.float()
+
+
+def _rot_torch(angle, axis, prepend_dim, device):
+    # build the rotation directly on device; angle may be a scalar or a (B,) tensor
+    angle = torch.as_tensor(angle, dtype=torch.float, device=device)
+    c, s = torch.cos(angle), torch.sin(angle)
+    o, z = torch.ones_like(angle), torch.zeros_like(angle)
+    if axis == 'x':
+        entries = [o, z, z, z, c, -s, z, s, c]
+    elif axis == 'y':
+        entries = [c, z, s, z, o, z, -s, z, c]
     else:
-        # Use only joints 25:49 (GT joints)
-        S = S[:, 25:, :].cpu().numpy()
-        joints_2d = joints_2d[:, 25:, :].cpu().numpy()
-    joints_conf = joints_2d[:, :, -1]
-    joints_2d = joints_2d[:, :, :-1]
-    trans = np.zeros((S.shape[0], 3), dtype=np.float32)
-    # Find the translation for each example in the batch
-    for i in range(S.shape[0]):
-        S_i = S[i]
-        joints_i = joints_2d[i]
-        conf_i = joints_conf[i]
-        trans[i] = estimate_translation_np(S_i,
-                                           joints_i,
-                                           conf_i,
-                                           focal_length=focal_length[i],
-                                           img_size=img_size[i])
-    return torch.from_numpy(trans).to(device)
+        entries = [c, -s, z, s, c, z, z, z, o]
+    m = torch.stack(entries, dim=-1).view(angle.shape + (3, 3))
+    if prepend_dim and angle.dim() == 0:
+        return m.unsqueeze(0)
+    return m
 
 
 def Rot_y(angle, category='torch', prepend_dim=True, device=None):
@@ -583,16 +633,13 @@ def Rot_y(angle, category='torch', prepend_dim=True, device=None):
 	Args:
 		category: 'torch' or 'numpy'
 		prepend_dim: prepend an extra dimension
-	Return: Rotation matrix with shape [1, 3, 3] (prepend_dim=True)
+	Return: Rotation matrix with shape [1, 3, 3] (prepend_dim=True), [B, 3, 3] for a (B,) angle tensor
 	'''
-    m = np.array([[np.cos(angle), 0., np.sin(angle)], [0., 1., 0.],
-                  [-np.sin(angle), 0., np.cos(angle)]])
     if category == 'torch':
-        if prepend_dim:
-            return torch.tensor(m, dtype=torch.float, device=device).unsqueeze(0)
-        else:
-            return torch.tensor(m, dtype=torch.float, device=device)
+        return _rot_torch(angle, 'y', prepend_dim, device)
     elif category == 'numpy':
+        m = np.array([[np.cos(angle), 0., np.sin(angle)], [0., 1., 0.],
+                      [-np.sin(angle), 0., np.cos(angle)]])
         if prepend_dim:
             return np.expand_dims(m, 0)
         else:
@@ -606,16 +653,13 @@ def Rot_x(angle, category='torch', prepend_dim=True, device=None):
 	Args:
 		category: 'torch' or 'numpy'
 		prepend_dim: prepend an extra dimension
-	Return: Rotation matrix with shape [1, 3, 3] (prepend_dim=True)
+	Return: Rotation matrix with shape [1, 3, 3] (prepend_dim=True), [B, 3, 3] for a (B,) angle tensor
 	'''
-    m = np.array([[1., 0., 0.], [0., np.cos(angle), -np.sin(angle)],
-                  [0., np.sin(angle), np.cos(angle)]])
     if category == 'torch':
-        if prepend_dim:
-            return torch.tensor(m, dtype=torch.float, device=device).unsqueeze(0)
-        else:
-            return torch.tensor(m, dtype=torch.float, device=device)
+        return _rot_torch(angle, 'x', prepend_dim, device)
     elif category == 'numpy':
+        m = np.array([[1., 0., 0.], [0., np.cos(angle), -np.sin(angle)],
+                      [0., np.sin(angle), np.cos(angle)]])
         if prepend_dim:
             return np.expand_dims(m, 0)
         else:
@@ -629,16 +673,13 @@ def Rot_z(angle, category='torch', prepend_dim=True, device=None):
 	Args:
 		category: 'torch' or 'numpy'
 		prepend_dim: prepend an extra dimension
-	Return: Rotation matrix with shape [1, 3, 3] (prepend_dim=True)
+	Return: Rotation matrix with shape [1, 3, 3] (prepend_dim=True), [B, 3, 3] for a (B,) angle tensor
 	'''
-    m = np.array([[np.cos(angle), -np.sin(angle), 0.], [np.sin(angle),
-                                                        np.cos(angle), 0.], [0., 0., 1.]])
     if category == 'torch':
-        if prepend_dim:
-            return torch.tensor(m, dtype=torch.float, device=device).unsqueeze(0)
-        else:
-            return torch.tensor(m, dtype=torch.float, device=device)
+        return _rot_torch(angle, 'z', prepend_dim, device)
     elif category == 'numpy':
+        m = np.array([[np.cos(angle), -np.sin(angle), 0.], [np.sin(angle),
+                                                            np.cos(angle), 0.], [0., 0., 1.]])
         if prepend_dim:
             return np.expand_dims(m, 0)
         else:
@@ -647,6 +688,7 @@ def Rot_z(angle, category='torch', prepend_dim=True, device=None):
         raise ValueError("category must be 'torch' or 'numpy'")
 
 
+@torch.jit.script
 def compute_twist_rotation(rotation_matrix, twist_axis):
     '''
     Compute the twist component of given rotation and twist axis
@@ -662,17 +704,18 @@ def compute_twist_rotation(rotation_matrix, twist_axis):
     Tensor (B, 3, 3)
         The twist rotation
     '''
-    quaternion = rotation_matrix_to_quaternion(rotation_matrix)
+    # scripted helpers are inlined by TorchScript, so the whole twist extraction is one graph
+    quaternion = _rotation_matrix_to_quaternion(rotation_matrix, 1e-6)
 
-    twist_axis = twist_axis / (torch.norm(twist_axis, dim=1, keepdim=True) + 1e-9)
+    twist_axis = twist_axis * (twist_axis.pow(2).sum(1, keepdim=True) + 1e-18).rsqrt()
 
-    projection = torch.einsum('bi,bi->b', twist_axis, quaternion[:, 1:]).unsqueeze(-1) * twist_axis
+    twist_proj = (twist_axis * quaternion[:, 1:]).sum(-1, keepdim=True) * twist_axis
 
-    twist_quaternion = torch.cat([quaternion[:, 0:1], projection], dim=1)
-    twist_quaternion = twist_quaternion / (torch.norm(twist_quaternion, dim=1, keepdim=True) + 1e-9)
+    twist_quaternion = torch.cat([quaternion[:, 0:1], twist_proj], dim=1)
+    twist_quaternion = _normalize_quat(twist_quaternion)
 
-    twist_rotation = quaternion_to_rotation_matrix(twist_quaternion)
-    twist_aa = quaternion_to_angle_axis(twist_quaternion)
+    twist_rotation = quat_to_rotmat(twist_quaternion)
+    twist_aa = _quaternion_to_angle_axis(twist_quaternion)
 
     twist_angle = torch.sum(twist_aa, dim=1, keepdim=True) / torch.sum(
         twist_axis, dim=1, keepdim=True)